@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import List, Dict, Any, TypedDict
 
 
-@dataclass
+@dataclass(slots=True)
 class PaginatedReleaseRequest:
     """
     Paginated release request class.
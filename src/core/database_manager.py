@@ -1,10 +1,14 @@
-from contextlib import contextmanager
+from collections import OrderedDict
+from contextlib import contextmanager, nullcontext
+from itertools import islice
 import logging
+from operator import itemgetter
 import os
 from pathlib import Path
 import sqlite3
 from sqlite3 import Connection, Cursor
-from typing import Dict, List
+import threading
+from typing import Callable, Dict, Iterable, List
 
 from core.core_classes import PaginatedReleaseRequest
 
@@ -20,12 +24,60 @@ class DatabaseManager:
     BASE_DIR = CORE_DIR.parent.parent
     CACHE_FOLDER = BASE_DIR / "cache"
     BLANKS_LABEL = "[Blanks]"
+    # Release links are built from the ID when read, rather than stored
+    RELEASE_URL_PREFIX = "https://www.discogs.com/release/"
+    COMMIT_BATCH_SIZE = 500
+    HYDRATE_CHUNK_SIZE = 900
+    COUNT_CACHE_SIZE = 128
+    PAGE_CACHE_SIZE = 64
+    # Size of the connection's prepared statement cache. The page queries
+    # vary with the filters, so keep enough room that the fixed ingest and
+    # lookup statements are not evicted.
+    STATEMENT_CACHE_SIZE = 256
+    # Upsert for a release, skipping the write when nothing has changed
+    UPSERT_RELEASE_QUERY = """
+    INSERT INTO releases (id, master_id, title, year, thumb_url, format, artists_sort)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO UPDATE SET
+        master_id = excluded.master_id,
+        title = excluded.title,
+        year = excluded.year,
+        thumb_url = excluded.thumb_url,
+        format = excluded.format,
+        artists_sort = COALESCE(excluded.artists_sort, releases.artists_sort)
+    WHERE (
+        releases.master_id, releases.title, releases.year,
+        releases.thumb_url, releases.format
+    ) IS NOT (
+        excluded.master_id, excluded.title, excluded.year,
+        excluded.thumb_url, excluded.format
+    ) OR excluded.artists_sort IS NOT NULL
+    """
+    # Lookup tables that releases are resolved against during ingestion.
+    LOOKUP_TABLES = ("genres", "styles", "labels")
+    # Queries for fetching the lookup tables, built once. Genres keep their
+    # insertion order, while styles and labels are sorted by name.
+    GET_ALL_QUERIES = {
+        table: f"SELECT id, name FROM {table} ORDER BY {order};"
+        for table, order in (("genres", "id"), ("styles", "name"), ("labels", "name"))
+    }
 
     def __init__(self):
         """
         Class initialisation function
         """
         self.custom_ids = set()
+        self._db_path: Path | None = None
+        # LRU cache of filtered counts, keyed on the count query parameters
+        self._count_cache: OrderedDict[tuple, int] = OrderedDict()
+        # LRU cache of hydrated pages, keyed on the page query parameters
+        self._page_cache: OrderedDict[tuple, list] = OrderedDict()
+        # Name to ID mappings of the lookup tables, keyed on table name
+        self._name_id_cache: Dict[str, Dict[str, int]] = {}
+        # A single long-lived connection is shared between the UI and the
+        # background refresh threads, so access to it is serialised by a lock.
+        self._lock = threading.RLock()
+        self._conn = self._open_connection()
         # Ensure the database and tables exist immediately
         self._init_db()
         # Load any existing custom field tables into memory
@@ -38,107 +90,278 @@ class DatabaseManager:
 
         :return: Path to SQLite database file.
         """
-        self.CACHE_FOLDER.mkdir(parents=True, exist_ok=True)
-        return self.CACHE_FOLDER / "collection.db"
+        if self._db_path is None:
+            self.CACHE_FOLDER.mkdir(parents=True, exist_ok=True)
+            self._db_path = self.CACHE_FOLDER / "collection.db"
+        return self._db_path
+
+    def _open_connection(self) -> Connection:
+        """
+        Open the long-lived database connection and apply the PRAGMAs.
+
+        :return: Database connection.
+        :rtype: Connection
+        """
+        conn = sqlite3.connect(
+            self._get_db_path(),
+            check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row  # Allows accessing columns by name
+        self._apply_pragmas(conn)
+        return conn
 
     @contextmanager
     def _get_db_connection(self):
         """
         Context manager for database connections.
+
+        Yields the shared connection as a transaction scope - any open
+        transaction is committed on exit, or rolled back on an exception.
         """
-        conn = sqlite3.connect(self._get_db_path())
-        conn.row_factory = sqlite3.Row  # Allows accessing columns by name
+        with self._lock:
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def _apply_pragmas(self, conn: Connection):
+        """
+        Apply the performance PRAGMAs to a new connection, and enforce the
+        foreign keys declared in the schema.
+
+        :param conn: Database connection
+        :type conn: Connection
+        """
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MB
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        conn.execute("PRAGMA foreign_keys=ON")
+
+    @contextmanager
+    def _bulk_load_mode(self):
+        """
+        Context manager to trade durability for write speed during the
+        initial import into an empty database. Nothing is lost if a crash
+        happens mid-import, as the import can simply be run again. It is
+        not used once the database holds releases, as their custom fields
+        and notes are then protected by the WAL. The WAL settings are
+        restored on exit.
+
+        The lock is only held while the PRAGMAs are changed, not for the
+        whole load. The exclusive file lock only shuts out other
+        connections, so the UI's reads on the shared connection can still
+        run between the batch writes.
+        """
+        with self._lock:
+            self._conn.execute("PRAGMA synchronous=OFF")
+            self._conn.execute("PRAGMA journal_mode=MEMORY")
+            self._conn.execute("PRAGMA locking_mode=EXCLUSIVE")
         try:
-            yield conn
+            yield
         finally:
-            conn.close()
+            with self._lock:
+                # The journal mode can't be changed inside a transaction
+                if self._conn.in_transaction:
+                    self._conn.rollback()
+                self._conn.execute("PRAGMA locking_mode=NORMAL")
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._conn.close()
+
+    def rebuild(self, clear_files: Callable[[], None]):
+        """
+        Close the database, clear its files and open a new empty database in
+        their place. The lock is held throughout, so a read waiting on it
+        runs against the new database rather than the closed connection.
+
+        :param clear_files: Callback which removes the database files.
+        :type clear_files: Callable[[], None]
+        """
+        with self._lock:
+            self._conn.close()
+            clear_files()
+            # The cached path may point into a folder that was removed
+            self._db_path = None
+            self._conn = self._open_connection()
+            self._clear_result_caches()
+            self._name_id_cache.clear()
+            self._init_db()
+            self._load_custom_field_ids_from_db()
 
     def _init_db(self):
         """
         Initialise the database by creating normalised tables if they don't
         exist.
-        """
-        schema_path = self.CORE_DIR / "table_schema.txt"
 
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema not found at {schema_path}")
-
-        schema = schema_path.read_text(encoding="utf-8")
+        The indexes are only created here if the database already holds
+        releases. For a new database, they are created after the first bulk
+        load by add_releases_to_db, so the load doesn't maintain them row by
+        row.
+        """
+        schema = self._read_schema("table_schema.txt")
 
         with self._get_db_connection() as conn:
             conn.executescript(schema)
+            self._migrate_db(conn)
             conn.commit()
+            if self._has_releases(conn):
+                self._create_indexes(conn)
         logging.debug("Database tables created.")
 
-    def _insert_lookup(
-        self, cursor: Cursor, table: str, name_col: str, value: str
-    ) -> int | None:
+    @staticmethod
+    def _has_releases(conn: Connection) -> bool:
         """
-        Helper to insert a value into lookup tables and return ID.
+        Check whether the database holds any releases.
 
-        :param cursor: SQLite cursor
-        :type cursor: Cursor
-        :param table: Table name
-        :type table: str
-        :param name_col: Column name for the value
-        :type name_col: str
-        :param value: Value to insert/look up
-        :type value: str
-        :return: ID of the inserted or existing row
-        :rtype: int | None
+        :param conn: Database connection
+        :type conn: Connection
+        :return: True if the releases table is not empty.
+        :rtype: bool
         """
-        if not value:
-            return None
+        return conn.execute("SELECT 1 FROM releases LIMIT 1").fetchone() is not None
 
-        # Try to find existing
-        cursor.execute(f"SELECT id FROM {table} WHERE {name_col} = ?", (value,))
-        res = cursor.fetchone()
-        if res:
-            return res["id"]
+    def _read_schema(self, file_name: str) -> str:
+        """
+        Read an SQL schema file from the core directory.
 
-        # Insert new
-        cursor.execute(f"INSERT INTO {table} ({name_col}) VALUES (?)", (value,))
-        return cursor.lastrowid
+        :param file_name: Name of the schema file
+        :type file_name: str
+        :return: Contents of the schema file
+        :rtype: str
+        """
+        schema_path = self.CORE_DIR / file_name
+
+        if not schema_path.exists():
+            raise FileNotFoundError(f"Schema not found at {schema_path}")
 
-    def _save_release_to_release_db(self, conn: Connection, basic_info: dict):
+        return schema_path.read_text(encoding="utf-8")
+
+    def _create_indexes(self, conn: Connection):
         """
-        Upserts the release into the main releases database.
+        Create the indexes if they don't exist. This commits any open
+        transaction.
 
         :param conn: Database connection
         :type conn: Connection
-        :param basic_info: Basic information dictionary from Discogs release
-        :type basic_info: dict
         """
-        rel_id = basic_info.get("id")
-        if not rel_id:
-            return
+        conn.executescript(self._read_schema("index_schema.txt"))
+        logging.debug("Database indexes created.")
 
-        cursor = conn.cursor()
+    def _migrate_db(self, conn: Connection):
+        """
+        Bring tables created by an older schema up to date.
 
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO releases (id, master_id, title, year, thumb_url, release_url, format)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                rel_id,
-                basic_info.get("master_id", 0),
-                basic_info.get("title", ""),
-                basic_info.get("year", ""),
-                basic_info.get("thumb", ""),
-                f"https://www.discogs.com/release/{rel_id}",
-                basic_info.get("formats", {})[0].get("name", ""),
-            ),
-        )
+        :param conn: Database connection
+        :type conn: Connection
+        """
+        release_columns = {
+            row["name"] for row in conn.execute("PRAGMA table_info(releases)")
+        }
+        if "artists_sort" not in release_columns:
+            conn.execute("ALTER TABLE releases ADD COLUMN artists_sort TEXT")
+            logging.debug("Added artists_sort column to releases.")
+        # DROP COLUMN needs SQLite 3.35, otherwise the old column is unused
+        if (
+            "release_url" in release_columns
+            and sqlite3.sqlite_version_info >= (3, 35, 0)
+        ):
+            conn.execute("ALTER TABLE releases DROP COLUMN release_url")
+            logging.debug("Dropped release_url column from releases.")
+        # The release artist sort is a per-release subquery, which can't use
+        # this index, so it is no longer kept up to date on every ingest
+        conn.execute("DROP INDEX IF EXISTS idx_artists_sort_name")
+
+    def _bulk_resolve(
+        self, cursor: Cursor, table: str, name_col: str, values: list[str]
+    ) -> Dict[str, int]:
+        """
+        Helper to insert a set of values into a lookup table and return their
+        IDs. Known values are answered from the name to ID lookup cache, so
+        only values not seen before are bulk inserted and selected back.
 
-        conn.commit()
+        :param cursor: SQLite cursor
+        :type cursor: Cursor
+        :param table: Table name
+        :type table: str
+        :param name_col: Column name for the values
+        :type name_col: str
+        :param values: Values to insert/look up
+        :type values: list[str]
+        :return: Dictionary mapping each value to its row ID
+        :rtype: Dict[str, int]
+        """
+        # Skip blank values and duplicates
+        values = list(dict.fromkeys(v for v in values if v))
+        if not values:
+            return {}
+
+        cache = self._name_id_cache.setdefault(table, {})
+        missing = [v for v in values if v not in cache]
+        if missing:
+            cursor.executemany(
+                f"INSERT OR IGNORE INTO {table} ({name_col}) VALUES (?)",
+                [(v,) for v in missing],
+            )
+            placeholders = ", ".join(["?"] * len(missing))
+            cursor.execute(
+                f"SELECT id, {name_col} FROM {table} WHERE {name_col} IN ({placeholders})",
+                missing,
+            )
+            cache.update((row[name_col], row["id"]) for row in cursor.fetchall())
+        return {v: cache[v] for v in values if v in cache}
+
+    def _prime_lookup_cache(self):
+        """
+        Load the full name to ID mapping of each of the LOOKUP_TABLES into
+        the lookup cache, so that ingestion can resolve names without
+        querying SQLite.
+        """
+        for table in self.LOOKUP_TABLES:
+            if table not in self._name_id_cache:
+                self._name_id_cache[table] = self._get_all_ids_by_name(table)
+
+    def _save_releases_to_release_db(self, cursor: Cursor, infos: List[dict]):
+        """
+        Upserts a batch of releases into the main releases database.
+
+        :param cursor: SQLite cursor
+        :type cursor: Cursor
+        :param infos: Basic information dictionaries from Discogs releases
+        :type infos: List[dict]
+        """
+        cursor.executemany(
+            self.UPSERT_RELEASE_QUERY,
+            [
+                (
+                    info["id"],
+                    info.get("master_id", 0),
+                    info.get("title", ""),
+                    info.get("year", ""),
+                    info.get("thumb", ""),
+                    info.get("formats", {})[0].get("name", ""),
+                    info.get("artists_sort"),
+                )
+                for info in infos
+            ],
+        )
 
     def _load_custom_field_ids_from_db(self):
         """
         Loads all known custom field IDs by querying the SQLite master table.
         This ensures custom fields are available even if fetch_collection isn't run.
         """
-        self.custom_ids = set()
+        custom_ids = set()
 
         # Query the SQLite master table to find all tables matching the pattern
         query = "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'custom_field_%';"
@@ -150,10 +373,15 @@ class DatabaseManager:
                 # Extract the ID from the table name (e.g., 'custom_field_1' -> '1')
                 try:
                     field_id = int(table_name.replace("custom_field_", ""))
-                    self.custom_ids.add(field_id)
+                    custom_ids.add(field_id)
                 except ValueError:
                     # Ignore tables that don't follow the naming convention
                     continue
+            # Cached pages hold a column for each custom field, so they are
+            # stale once a field is added or removed
+            if custom_ids != self.custom_ids:
+                self._clear_result_caches()
+            self.custom_ids = custom_ids
 
     def get_custom_field_ids_set(self) -> set:
         """
@@ -164,142 +392,221 @@ class DatabaseManager:
         """
         return self.custom_ids
 
-    def _save_artist_to_artist_db(self, conn: Connection, basic_info: dict):
+    def _save_artists_to_artist_db(self, cursor: Cursor, infos: List[dict]):
         """
-        Sort the release into the relevant artist databases.
+        Sort a batch of releases into the relevant artist databases.
 
-        :param conn: Database connection
-        :type conn: Connection
-        :param basic_info: Basic information dictionary from Discogs release
-        :type basic_info: dict
+        :param cursor: SQLite cursor
+        :type cursor: Cursor
+        :param infos: Basic information dictionaries from Discogs releases
+        :type infos: List[dict]
+        """
+        artist_rows = []
+        link_rows = []
+        for info in infos:
+            for i, artist in enumerate(info.get("artists", [])):
+                artist_rows.append((artist.get("id"), artist.get("name")))
+                link_rows.append((info["id"], artist.get("id"), 1 if i == 0 else 0))
+
+        # Insert Artist if not exists
+        cursor.executemany(
+            "INSERT OR IGNORE INTO artists (id, name) VALUES (?, ?)", artist_rows
+        )
+        self._sync_links(
+            cursor,
+            "release_artists",
+            ("release_id", "artist_id", "is_primary"),
+            infos,
+            link_rows,
+            "INSERT OR IGNORE",
+        )
+
+    def _sync_links(
+        self,
+        cursor: Cursor,
+        table: str,
+        columns: tuple[str, ...],
+        infos: List[dict],
+        rows: list[tuple],
+        insert: str = "INSERT",
+    ):
         """
-        rel_id = basic_info.get("id")
-        if not rel_id:
-            return
+        Bring the junction table rows of a batch of releases in line with
+        the given rows. Only rows which have been removed or added are
+        written, so re-syncing unchanged releases doesn't touch the table.
 
-        cursor = conn.cursor()
-        # Clear old links for this release to prevent duplication on updates
-        cursor.execute("DELETE FROM release_artists WHERE release_id = ?", (rel_id,))
-        for i, artist in enumerate(basic_info.get("artists", [])):
-            a_id = artist.get("id")
-            a_name = artist.get("name")
-            # Insert Artist if not exists
-            cursor.execute(
-                "INSERT OR IGNORE INTO artists (id, name) VALUES (?, ?)", (a_id, a_name)
-            )
-            cursor.execute(
-                "INSERT OR IGNORE INTO release_artists (release_id, artist_id, is_primary) VALUES (?, ?, ?)",
-                (rel_id, a_id, 1 if i == 0 else 0),
-            )
+        :param cursor: SQLite cursor
+        :type cursor: Cursor
+        :param table: Junction table name
+        :type table: str
+        :param columns: Columns of the junction table, release_id first
+        :type columns: tuple[str, ...]
+        :param infos: Basic information dictionaries from Discogs releases
+        :type infos: List[dict]
+        :param rows: Wanted rows for the releases, in the order of columns
+        :type rows: list[tuple]
+        :param insert: Insert statement verb, e.g. 'INSERT OR IGNORE'
+        :type insert: str
+        """
+        rel_ids = [info["id"] for info in infos]
+        placeholders = ", ".join(["?"] * len(rel_ids))
+        cursor.execute(
+            f"SELECT {', '.join(columns)} FROM {table} WHERE release_id IN ({placeholders})",
+            rel_ids,
+        )
+        existing = set(map(tuple, cursor.fetchall()))
+        wanted = dict.fromkeys(rows)
 
-        conn.commit()
+        # IS rather than = so that NULL values (e.g. a missing catno) match
+        cursor.executemany(
+            f"DELETE FROM {table} WHERE {' AND '.join(f'{c} IS ?' for c in columns)}",
+            [row for row in existing if row not in wanted],
+        )
+        cursor.executemany(
+            f"{insert} INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})",
+            [row for row in wanted if row not in existing],
+        )
 
-    def _save_style_genre_label_to_dbs(self, conn: Connection, basic_info: dict):
+    def _save_style_genre_label_to_dbs(self, cursor: Cursor, infos: List[dict]):
         """
-        Save the style, genre and label info into relevant databases.
+        Save the style, genre and label info for a batch of releases into
+        the relevant databases.
 
-        :param conn: Database connection
-        :type conn: Connection
-        :param basic_info: Basic information dictionary from Discogs release
-        :type basic_info: dict
+        :param cursor: SQLite cursor
+        :type cursor: Cursor
+        :param infos: Basic information dictionaries from Discogs releases
+        :type infos: List[dict]
         """
-        rel_id = basic_info.get("id")
-        if not rel_id:
-            return
+        genre_ids = self._bulk_resolve(
+            cursor, "genres", "name", [g for i in infos for g in i.get("genres", [])]
+        )
+        genre_rows = [
+            (info["id"], genre_ids.get(genre))
+            for info in infos
+            for genre in info.get("genres", [])
+        ]
+        self._sync_links(
+            cursor, "release_genres", ("release_id", "genre_id"), infos, genre_rows
+        )
 
-        cursor = conn.cursor()
+        style_ids = self._bulk_resolve(
+            cursor, "styles", "name", [s for i in infos for s in i.get("styles", [])]
+        )
+        style_rows = [
+            (info["id"], style_ids.get(s))
+            for info in infos
+            for s in info.get("styles", [])
+        ]
+        self._sync_links(
+            cursor, "release_styles", ("release_id", "style_id"), infos, style_rows
+        )
 
-        cursor.execute("DELETE FROM release_genres WHERE release_id = ?", (rel_id,))
-        for genre in basic_info.get("genres", []):
-            g_id = self._insert_lookup(cursor, "genres", "name", genre)
-            cursor.execute("INSERT INTO release_genres VALUES (?, ?)", (rel_id, g_id))
+        label_ids = self._bulk_resolve(
+            cursor,
+            "labels",
+            "name",
+            [label.get("name") for i in infos for label in i.get("labels", [])],
+        )
+        label_rows = [
+            (info["id"], label_ids.get(label.get("name")), label.get("catno"))
+            for info in infos
+            for label in info.get("labels", [])
+        ]
+        self._sync_links(
+            cursor,
+            "release_labels",
+            ("release_id", "label_id", "catno"),
+            infos,
+            label_rows,
+        )
 
-        cursor.execute("DELETE FROM release_styles WHERE release_id = ?", (rel_id,))
-        for s in basic_info.get("styles", []):
-            s_id = self._insert_lookup(cursor, "styles", "name", s)
-            cursor.execute("INSERT INTO release_styles VALUES (?, ?)", (rel_id, s_id))
+    def _save_custom_notes_to_dbs(
+        self, cursor: Cursor, batch: List[tuple[dict, list | None]]
+    ):
+        """
+        Save the custom notes for a batch of releases to the databases.
 
-        cursor.execute("DELETE FROM release_labels WHERE release_id = ?", (rel_id,))
-        for label in basic_info.get("labels", []):
-            l_name = label.get("name")
-            l_cat = label.get("catno")
-            l_id = self._insert_lookup(cursor, "labels", "name", l_name)
-            cursor.execute(
-                "INSERT INTO release_labels VALUES (?, ?, ?)", (rel_id, l_id, l_cat)
-            )
+        :param cursor: SQLite cursor
+        :type cursor: Cursor
+        :param batch: List of (basic_info, notes) tuples
+        :type batch: List[tuple[dict, list | None]]
+        """
+        # Group the notes by field so each custom table gets one executemany.
+        # The custom field tables are created by add_releases_to_db.
+        rows_by_field: Dict[int, list] = {}
+        for info, notes in batch:
+            for note in notes or []:
+                rows_by_field.setdefault(note.get("field_id"), []).append(
+                    (info["id"], note.get("value", "").strip())
+                )
 
-        conn.commit()
+        for field_id, rows in rows_by_field.items():
+            cursor.executemany(
+                f"""
+                INSERT INTO custom_field_{field_id} (release_id, field_value)
+                VALUES (?, ?)
+                ON CONFLICT(release_id) DO UPDATE SET
+                    field_value = excluded.field_value
+            """,
+                rows,
+            )
 
-    def _save_custom_notes_to_dbs(
-        self, conn: Connection, basic_info: dict, notes: dict | None = None
+    def save_releases_to_db(
+        self, cursor: Cursor, batch: List[tuple[dict, list | None]]
     ):
         """
-        Save the custom notes to the databases.
+        Parses a batch of release dictionaries and saves them to the
+        normalised DB, with one executemany per table for the whole batch.
 
-        :param conn: Database connection
-        :type conn: Connection
-        :param basic_info: Basic information dictionary from Discogs release
-        :type basic_info: dict
-        :param notes: Optional custom notes associated with the release
-        :type notes: dict | None
-        """
-        rel_id = basic_info.get("id")
-        if not rel_id:
-            return
+        The caller is responsible for committing the transaction.
 
-        # Firstly check the custom field IDs and create tables if necessary
-        if notes is not None:
-            for note in notes:
-                field_id = note.get("field_id")
-                # Create the table
-                self.create_custom_field_db(conn, field_id)
-                logging.debug(f"Creating custom field ID {field_id}")
-
-        cursor = conn.cursor()
-        if notes is not None:
-            for note in notes:
-                field_id = note.get("field_id")
-                note = note.get("value", "").strip()
-                table_name = f"custom_field_{field_id}"
-                cursor.execute(
-                    f"""
-                    INSERT OR REPLACE INTO {table_name} (release_id, field_value)
-                    VALUES (?, ?)
-                """,
-                    (rel_id, note),
-                )
+        :param cursor: SQLite cursor.
+        :type cursor: Cursor
+        :param batch: List of (basic_info, notes) tuples
+        :type batch: List[tuple[dict, list | None]]
+        """
+        # A release can be in the collection more than once; as with saving
+        # one at a time, the last copy wins.
+        latest = {info["id"]: (info, notes) for info, notes in batch if info.get("id")}
+        batch = list(latest.values())
+        if not batch:
+            return
+        infos = [info for info, _ in batch]
 
-        conn.commit()
+        self._save_releases_to_release_db(cursor, infos)
+        self._save_artists_to_artist_db(cursor, infos)
+        self._save_style_genre_label_to_dbs(cursor, infos)
+        self._save_custom_notes_to_dbs(cursor, batch)
 
     def save_release_to_db(
-        self, conn: Connection, basic_info: dict, notes: dict | None = None
+        self, cursor: Cursor, basic_info: dict, notes: dict | None = None
     ):
         """
         Parses a single release dictionary and saves to normalised DB.
 
-        :param conn: Database connection.
-        :type conn: Connection
+        The caller is responsible for committing the transaction.
+
+        :param cursor: SQLite cursor.
+        :type cursor: Cursor
         :param basic_info: Basic information dictionary from Discogs release
         :type basic_info: dict
         :param notes: Optional custom notes associated with the release
         :type notes: dict | None
         """
+        self.save_releases_to_db(cursor, [(basic_info, notes)])
 
-        self._save_release_to_release_db(conn, basic_info)
-        self._save_artist_to_artist_db(conn, basic_info)
-        self._save_style_genre_label_to_dbs(conn, basic_info)
-        self._save_custom_notes_to_dbs(conn, basic_info, notes)
-
-    def create_custom_field_db(self, conn: Connection, field_id: int):
+    def create_custom_field_db(self, cursor: Cursor, field_id: int):
         """
         Create a table for storing custom field values.
 
-        :param conn: Database connection
-        :type conn: Connection
+        :param cursor: SQLite cursor
+        :type cursor: Cursor
         :param field_id: ID of the custom field
         :type field_id: int
         """
         table_name = f"custom_field_{field_id}"
+        # Use execute() rather than executescript(), as the latter would
+        # commit the surrounding transaction.
         schema = f"""
         CREATE TABLE IF NOT EXISTS {table_name} (
             release_id INTEGER PRIMARY KEY,
@@ -307,19 +614,78 @@ class DatabaseManager:
             FOREIGN KEY(release_id) REFERENCES releases(id)
         );
         """
-        conn.executescript(schema)
-        conn.commit()
+        cursor.execute(schema)
 
-    def add_releases_to_db(self, release_list: list):
+    def add_releases_to_db(self, releases: Iterable[tuple[dict, list | None]]):
         """
-        Add a list of releases fetched from Discogs to the database.
+        Add releases fetched from Discogs to the database.
+
+        The releases can be any iterable (e.g. a generator), so they are
+        written as they arrive rather than being collected into a list first.
+        Releases are read in batches of COMMIT_BATCH_SIZE without holding
+        the lock, so a generator fetching them from Discogs doesn't block
+        the UI's reads. Each batch is then written and committed in its own
+        transaction, with one executemany per table per batch rather than
+        per release. The initial import into an empty database runs in bulk
+        load mode, while later refreshes keep the WAL.
 
-        :param release_list: List of releases to add.
-        :type release_list: list
+        :param releases: Iterable of (basic_info, notes) tuples to add.
+        :type releases: Iterable[tuple[dict, list | None]]
         """
+        # Custom field tables are created the first time each ID is seen
+        created_field_ids = set()
+
+        with self._lock:
+            # The genre/style/label lookups stay valid, as ingestion only
+            # adds to them, and are kept up to date by _bulk_resolve.
+            self._prime_lookup_cache()
+            initial_import = not self._has_releases(self._conn)
+
+        releases = iter(releases)
+        with self._bulk_load_mode() if initial_import else nullcontext():
+            while batch := list(islice(releases, self.COMMIT_BATCH_SIZE)):
+                self._add_release_batch(batch, created_field_ids)
+
         with self._get_db_connection() as conn:
-            for basic_info, notes in release_list:
-                self.save_release_to_db(conn, basic_info, notes)
+            # Build any indexes skipped for a new database, then refresh the
+            # query planner statistics now the data has changed
+            self._create_indexes(conn)
+            conn.execute("ANALYZE")
+
+    def _add_release_batch(
+        self, batch: List[tuple[dict, list | None]], created_field_ids: set
+    ):
+        """
+        Write one batch of releases in a single transaction.
+
+        :param batch: Batch of (basic_info, notes) tuples to add.
+        :type batch: List[tuple[dict, list | None]]
+        :param created_field_ids: Custom field IDs whose tables already
+            exist, updated with any created for this batch.
+        :type created_field_ids: set
+        """
+        with self._lock:
+            try:
+                with self._get_db_connection() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("BEGIN IMMEDIATE")
+                    for _, notes in batch:
+                        for note in notes or []:
+                            field_id = note.get("field_id")
+                            if field_id not in created_field_ids:
+                                self.create_custom_field_db(cursor, field_id)
+                                created_field_ids.add(field_id)
+                                logging.debug(f"Creating custom field ID {field_id}")
+                    self.save_releases_to_db(cursor, batch)
+            except Exception:
+                # _bulk_resolve caches the IDs of new lookup rows before the
+                # commit, so they are dropped along with the rolled back rows
+                self._name_id_cache.clear()
+                raise
+            # Cached counts, pages and artist lookups read between the
+            # batches are stale once this batch is committed
+            self._clear_result_caches()
+            self._name_id_cache.pop("artists", None)
 
     def get_artists_missing_sort_name(self) -> list[int] | None:
         """
@@ -336,38 +702,59 @@ class DatabaseManager:
             )
             return cursor.fetchall()
 
-    def get_first_release_from_artist(self, artist_id: int) -> int | None:
+    def get_first_release_by_artist(self) -> Dict[int, tuple[int, str | None]]:
         """
-        Get the first release with the matching artist ID.
+        Get the first release ID, and its stored artists sort name if known,
+        for every artist in one query.
 
-        :param artist_id: Artist ID
-        :type artist_id: int
+        :return: Dictionary mapping artist ID to (release ID, artists sort).
+        :rtype: Dict[int, tuple[int, str | None]]
         """
         with self._get_db_connection() as conn:
-            return conn.execute(
-                "SELECT release_id FROM release_artists WHERE artist_id = ? LIMIT 1",
-                (artist_id,),
-            ).fetchone()
+            # SQLite takes the bare artists_sort column from the MIN() row
+            cursor = conn.execute(
+                """
+                SELECT ra.artist_id, MIN(ra.release_id), r.artists_sort
+                FROM release_artists ra
+                JOIN releases r ON ra.release_id = r.id
+                GROUP BY ra.artist_id
+                """
+            )
+            return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
 
-    def commit_batch_updates(self, updates_batch):
+    def commit_batch_updates(self, updates_batch, release_sorts_batch=None):
         """
-        Executes the database update for a given batch of (sort_name, id) tuples.
+        Executes the database update for a given batch of (sort_name, id)
+        tuples, along with any release artists sort names fetched on the way,
+        in a single transaction.
 
-        :param updates_batch: Batch of tuples
+        :param updates_batch: Batch of (sort_name, artist_id) tuples
+        :param release_sorts_batch: Optional batch of (artists_sort,
+            release_id) tuples, stored so they aren't fetched again
         """
         with self._get_db_connection() as conn:
             conn.executemany(
                 "UPDATE artists SET sort_name = ? WHERE id = ?", updates_batch
             )
-            conn.commit()
+            if release_sorts_batch:
+                conn.executemany(
+                    "UPDATE releases SET artists_sort = ? WHERE id = ?",
+                    release_sorts_batch,
+                )
+            # The artist sort order of cached pages may have changed
+            self._page_cache.clear()
 
     def delete_database(self):
         """
         Delete the database.
         """
-        db_path = self._get_db_path()
-        if os.path.exists(db_path):
-            os.remove(db_path)
+        self.close()
+        self._clear_result_caches()
+        self.clear_lookup_caches()
+        try:
+            os.remove(self._get_db_path())
+        except FileNotFoundError:
+            pass
 
     def _build_order_clause(self, sort_by: str, desc: bool) -> str:
         """
@@ -383,9 +770,12 @@ class DatabaseManager:
 
         order_dir = "DESC" if desc else "ASC"
 
-        # Check if the sort is by a custom field
+        # Check if the sort is by a custom field - this references the joined
+        # table alias so that it works in both the ID page and hydrate queries
         if sort_by.startswith("custom_") and sort_by.replace("custom_", "").isdigit():
-            return f"{sort_by} COLLATE NOCASE {order_dir}"
+            field_id = int(sort_by.replace("custom_", ""))
+            if field_id in self.custom_ids:
+                return f"cf{field_id}.field_value COLLATE NOCASE {order_dir}"
 
         allowed_sorts = ["title", "year", "date_added", "id", "artist"]
 
@@ -394,8 +784,14 @@ class DatabaseManager:
             sort_by = "date_added"
 
         if sort_by == "artist":
-            # Use sort_name for artist sorting (collation is typically needed for SQLite text sorting)
-            return f"COALESCE(a.sort_name, a.name) COLLATE NOCASE {order_dir}"
+            # Sort by the first artist saved for the release, which is the
+            # one shown first, using its sort_name if known. A subquery is
+            # used so the artists don't need joining to the filtered rows.
+            return f"""(
+                SELECT COALESCE(a.sort_name, a.name) FROM release_artists ra
+                JOIN artists a ON ra.artist_id = a.id
+                WHERE ra.release_id = r.id ORDER BY ra.rowid LIMIT 1
+            ) COLLATE NOCASE {order_dir}"""
         else:
             return f"r.{sort_by} {order_dir}"
 
@@ -409,7 +805,7 @@ class DatabaseManager:
         """
         Helper for simple filters like Artist ID or Format, using IN (?).
 
-        :param column: The fully qualified SQL column name (e.g., 'a.id' or 'r.format').
+        :param column: The fully qualified SQL column name (e.g., 'r.format').
         :type column: str
         :param values: A list of values (e.g., IDs or strings) to be included in the IN clause.
                        If the list is empty or None, no condition is added.
@@ -439,6 +835,8 @@ class DatabaseManager:
 
         This is necessary because these filters rely on junction tables (e.g., release_genres).
         It implements OR logic: find releases associated with ANY of the provided IDs.
+        A correlated EXISTS is used so SQLite can probe the (release_id, id)
+        index and stop at the first match.
 
         :param table: The name of the junction table (e.g., 'release_genres').
         :type table: str
@@ -455,9 +853,9 @@ class DatabaseManager:
         if ids:
             placeholders = ", ".join(["?"] * len(ids))
             condition = f"""
-            r.id IN (
-                SELECT release_id FROM {table} 
-                WHERE {column} IN ({placeholders})
+            EXISTS (
+                SELECT 1 FROM {table} jt
+                WHERE jt.release_id = r.id AND jt.{column} IN ({placeholders})
             )
             """
             conditions.append(condition)
@@ -526,6 +924,11 @@ class DatabaseManager:
     ) -> tuple[str, list]:
         """
         Constructs the SQL WHERE clause and prepares search parameters, now including Genre, Style, and Label filters.
+
+        The clause only references the releases table (r) and the custom
+        field aliases, using EXISTS subqueries for the artist, label and
+        style conditions. The count and the page of IDs then use the same
+        predicate, without the junction table joins.
         """
         conditions = []
         search_params = []
@@ -534,18 +937,34 @@ class DatabaseManager:
         if search_query:
             search_condition = """
             (
-                r.title LIKE ? OR r.year LIKE ? OR a.name LIKE ? OR 
-                l.name LIKE ? OR rl.catno LIKE ? OR s.name LIKE ?
+                r.title LIKE ? OR r.year LIKE ? OR
+                EXISTS (
+                    SELECT 1 FROM release_artists ra
+                    JOIN artists a ON ra.artist_id = a.id
+                    WHERE ra.release_id = r.id AND a.name LIKE ?
+                ) OR
+                EXISTS (
+                    SELECT 1 FROM release_labels rl
+                    LEFT JOIN labels l ON rl.label_id = l.id
+                    WHERE rl.release_id = r.id
+                    AND (l.name LIKE ? OR rl.catno LIKE ?)
+                ) OR
+                EXISTS (
+                    SELECT 1 FROM release_styles rs
+                    JOIN styles s ON rs.style_id = s.id
+                    WHERE rs.release_id = r.id AND s.name LIKE ?
+                )
             )
             """
             conditions.append(search_condition)
             term = f"%{search_query}%"
             search_params.extend([term] * 6)
 
-        # 2. Artist Filter (Simple IN condition)
-        self._build_in_condition(
-            column="a.id",
-            values=artist_ids,
+        # 2. Artist Filter (Subquery IN condition)
+        self._build_subquery_in_condition(
+            table="release_artists",
+            column="artist_id",
+            ids=artist_ids,
             conditions=conditions,
             params=search_params,
         )
@@ -604,17 +1023,22 @@ class DatabaseManager:
 
         return where_sql, search_params
 
-    def _build_custom_field_joins(self) -> tuple[str, str]:
+    def _build_custom_field_joins(
+        self, field_ids: Iterable[int] | None = None
+    ) -> tuple[str, str]:
         """
-        Builds the SELECT and JOIN clauses for all known custom fields.
+        Builds the SELECT and JOIN clauses for the known custom fields.
 
+        :param field_ids: Custom field IDs to build the clauses for, or None
+            for all known custom fields.
+        :type field_ids: Iterable[int] | None
         :returns: A tuple (custom_select_sql, custom_join_sql)
         :rtype: tuple[str, str]
         """
         custom_select_parts = []
         custom_join_parts = []
 
-        for field_id in self.custom_ids:
+        for field_id in self.custom_ids if field_ids is None else field_ids:
             table_name = f"custom_field_{field_id}"
             alias = f"cf{field_id}"
 
@@ -646,26 +1070,76 @@ class DatabaseManager:
         :returns: The total number of rows matching the criteria.
         :rtype: int
         """
-        # Get the required custom field joins
-        _, custom_join_sql = self._build_custom_field_joins()
+        # An unfiltered count needs no joins at all
+        if not where_sql:
+            return conn.execute("SELECT COUNT(*) FROM releases").fetchone()[0]
+
+        # Only join the custom fields the filters reference - these are
+        # one-to-one with the releases so do not need a DISTINCT
+        _, custom_join_sql = self._build_custom_field_joins(
+            field_id for field_id in self.custom_ids if f"cf{field_id}." in where_sql
+        )
 
         count_query = f"""
-        SELECT COUNT(DISTINCT r.id) 
+        SELECT COUNT(*)
         FROM releases r
-        LEFT JOIN release_artists ra ON r.id = ra.release_id
-        LEFT JOIN artists a ON ra.artist_id = a.id
-        LEFT JOIN release_labels rl ON r.id = rl.release_id
-        LEFT JOIN labels l ON rl.label_id = l.id
-        LEFT JOIN release_genres gs on r.id = gs.release_id
-        LEFT JOIN genres g on gs.genre_id = g.id
-        LEFT JOIN release_styles rs on r.id = rs.release_id
-        LEFT JOIN styles s on rs.style_id = s.id
         {custom_join_sql}
         {where_sql}
         """
         # Pass search_params to filter the count correctly
         return conn.execute(count_query, search_params).fetchone()[0]
 
+    def _get_cached_filtered_count(
+        self, conn, where_sql: str, search_params: list
+    ) -> int:
+        """
+        Gets the filtered count from the cache, or runs the COUNT query and
+        caches it. Paging through the same filters then only counts once.
+
+        :param conn: The active database connection object.
+        :type conn: object
+        :param where_sql: The WHERE SQL fragment, including 'WHERE' if present.
+        :type where_sql: str
+        :param search_params: The list of parameters for the search filter.
+        :type search_params: list
+        :returns: The total number of rows matching the criteria.
+        :rtype: int
+        """
+        key = (where_sql, tuple(search_params))
+        if key in self._count_cache:
+            self._count_cache.move_to_end(key)
+            return self._count_cache[key]
+
+        count = self._get_filtered_count(conn, where_sql, search_params)
+        self._lru_store(self._count_cache, key, count, self.COUNT_CACHE_SIZE)
+        return count
+
+    @staticmethod
+    def _lru_store(cache: OrderedDict, key: tuple, value, max_size: int):
+        """
+        Store a value in an LRU cache, evicting the least recently used entry
+        if the cache is full.
+
+        :param cache: The cache to store the value in.
+        :type cache: OrderedDict
+        :param key: Cache key.
+        :type key: tuple
+        :param value: Value to store.
+        :param max_size: Maximum number of entries in the cache.
+        :type max_size: int
+        """
+        cache[key] = value
+        if len(cache) > max_size:
+            cache.popitem(last=False)
+
+    def _clear_result_caches(self):
+        """
+        Clear the cached counts and pages, which are stale once the releases
+        change.
+        """
+        self._count_cache.clear()
+        self._page_cache.clear()
+
     def _get_pagination_limits(
         self, page_size: int, total_rows: int, offset: int
     ) -> tuple[int, int]:
@@ -687,9 +1161,12 @@ class DatabaseManager:
         else:
             return page_size, offset
 
-    def _build_main_query(self, where_sql: str, order_clause: str) -> str:
+    def _build_id_page_query(self, where_sql: str, order_clause: str) -> str:
         """
-        Constructs the main SQL query for fetching release data.
+        Constructs the SQL query for fetching one page of release IDs. Only
+        the IDs are selected here, so the aggregation is left to the much
+        smaller hydrate query. The custom fields are one-to-one with the
+        releases, so each release is only listed once without a GROUP BY.
 
         :param where_sql: The WHERE SQL fragment, including 'WHERE' if present.
         :type where_sql: str
@@ -698,34 +1175,119 @@ class DatabaseManager:
         :returns: The full parameterized SQL query string.
         :rtype: str
         """
+        _, custom_join_sql = self._build_custom_field_joins()
+
+        return f"""
+        SELECT r.id
+        FROM releases r
+        {custom_join_sql}
+        {where_sql}
+        ORDER BY {order_clause}
+        LIMIT ? OFFSET ?
+        """
+
+    def _build_main_query(self, id_count: int) -> str:
+        """
+        Constructs the main SQL query for hydrating the release data of a
+        page of release IDs.
+
+        :param id_count: The number of release IDs to hydrate.
+        :type id_count: int
+        :returns: The full parameterized SQL query string.
+        :rtype: str
+        """
         # Build the SELECT and JOIN clauses for the custom fields
         custom_select_sql, custom_join_sql = self._build_custom_field_joins()
+        placeholders = ", ".join(["?"] * id_count)
 
+        # Each list column is aggregated by its own correlated subquery,
+        # rather than joining every junction table at once and collapsing the
+        # resulting artists x labels x genres x styles rows with GROUP BY.
+        # Names are kept in the order they were saved, with duplicates
+        # removed.
         return f"""
         SELECT 
             r.id,
-            REPLACE(GROUP_CONCAT(DISTINCT a.name), ',', ', ') as artist_name,
+            {self._list_column_sql("release_artists", "artists", "artist_id")} as artist_name,
             r.title, 
-            REPLACE(GROUP_CONCAT(DISTINCT l.name), ',', ', ') as label_name,
-            REPLACE(GROUP_CONCAT(DISTINCT g.name), ',', ', ') as genres,
-            REPLACE(GROUP_CONCAT(DISTINCT s.name), ',', ', ') as style_name,
-            rl.catno, r.year, r.release_url, r.format, r.thumb_url
+            {self._list_column_sql("release_labels", "labels", "label_id")} as label_name,
+            {self._list_column_sql("release_genres", "genres", "genre_id")} as genres,
+            {self._list_column_sql("release_styles", "styles", "style_id")} as style_name,
+            (
+                SELECT rl.catno FROM release_labels rl
+                WHERE rl.release_id = r.id ORDER BY rl.rowid LIMIT 1
+            ) as catno,
+            r.year, '{self.RELEASE_URL_PREFIX}' || r.id as release_url,
+            r.format, r.thumb_url
             {custom_select_sql}
         FROM releases r
-        LEFT JOIN release_artists ra ON r.id = ra.release_id
-        LEFT JOIN artists a ON ra.artist_id = a.id
-        LEFT JOIN release_labels rl ON r.id = rl.release_id
-        LEFT JOIN release_genres gs on r.id = gs.release_id
-        LEFT JOIN genres g on gs.genre_id = g.id
-        LEFT JOIN labels l ON rl.label_id = l.id
-        LEFT JOIN release_styles rs on r.id = rs.release_id
-        LEFT JOIN styles s on rs.style_id = s.id
         {custom_join_sql}
-        {where_sql}
-        GROUP BY r.id
-        ORDER BY {order_clause}
-        LIMIT ? OFFSET ?
+        WHERE r.id IN ({placeholders})
+        """
+
+    @staticmethod
+    def _list_column_sql(junction: str, table: str, column: str) -> str:
+        """
+        Builds a correlated subquery which joins the names linked to a
+        release into a comma separated string.
+
+        :param junction: Junction table name (e.g. 'release_genres').
+        :type junction: str
+        :param table: Lookup table name (e.g. 'genres').
+        :type table: str
+        :param column: Column in the junction table referencing the lookup.
+        :type column: str
+        :returns: SQL expression for the list column.
+        :rtype: str
+        """
+        return f"""(
+                SELECT GROUP_CONCAT(name, ', ') FROM (
+                    SELECT t.name FROM {junction} jt
+                    JOIN {table} t ON jt.{column} = t.id
+                    WHERE jt.release_id = r.id
+                    GROUP BY t.name ORDER BY MIN(jt.rowid)
+                )
+            )"""
+
+    @staticmethod
+    def _dict_factory(cursor: Cursor, row: tuple) -> dict:
+        """
+        Row factory which returns each row as a dictionary keyed by column.
+
+        :param cursor: SQLite cursor
+        :type cursor: Cursor
+        :param row: Row values
+        :type row: tuple
+        :return: Dictionary of the row
+        :rtype: dict
+        """
+        return dict(zip([col[0] for col in cursor.description], row))
+
+    def _hydrate_releases(self, conn: Connection, release_ids: list[int]) -> list:
+        """
+        Fetches the full row data for a page of release IDs, preserving the
+        order of the IDs.
+
+        :param conn: The active database connection object.
+        :type conn: Connection
+        :param release_ids: Ordered list of release IDs to hydrate.
+        :type release_ids: list[int]
+        :returns: List of row dictionaries in the same order as the IDs.
+        :rtype: list
         """
+        rows_by_id = {}
+        # Chunk the IDs to stay under SQLite's bound parameter limit when
+        # fetching all releases
+        for start in range(0, len(release_ids), self.HYDRATE_CHUNK_SIZE):
+            chunk = release_ids[start : start + self.HYDRATE_CHUNK_SIZE]
+            # Build the row dictionaries directly, rather than via Row objects
+            cursor = conn.cursor()
+            cursor.row_factory = self._dict_factory
+            cursor.execute(self._build_main_query(len(chunk)), chunk)
+            for row in cursor.fetchall():
+                rows_by_id[row["id"]] = row
+
+        return [rows_by_id[release_id] for release_id in release_ids]
 
     def get_releases_paginated(
         self, request: PaginatedReleaseRequest
@@ -733,6 +1295,10 @@ class DatabaseManager:
         """
         Coordinates fetching releases with full support for search, sorting, and pagination.
 
+        The page of release IDs is found first using the filters and sort
+        order, and only those releases are then hydrated with the aggregated
+        artist, label, genre and style data.
+
         :param request: Request
         :type request: PaginatedReleaseRequest
         :return: Tuple containing the rows and total rows.
@@ -755,7 +1321,9 @@ class DatabaseManager:
 
         with self._get_db_connection() as conn:
             # 3. Get Total Count
-            total_rows = self._get_filtered_count(conn, where_sql, search_params)
+            total_rows = self._get_cached_filtered_count(
+                conn, where_sql, search_params
+            )
 
             # 4. Handle 'Fetch All' and Finalize Pagination Params
             limit, final_offset = self._get_pagination_limits(
@@ -763,12 +1331,59 @@ class DatabaseManager:
             )
             full_params = search_params + [limit, final_offset]
 
-            # 5. Fetch Data
-            query = self._build_main_query(where_sql, order_clause)
-            cursor = conn.execute(query, full_params)
-            rows = [dict(row) for row in cursor.fetchall()]
+            # Revisited pages are served from the page cache
+            key = (where_sql, order_clause, tuple(full_params))
+            if key in self._page_cache:
+                self._page_cache.move_to_end(key)
+                return list(self._page_cache[key]), total_rows
+
+            # 5. Fetch the page of IDs
+            id_query = self._build_id_page_query(where_sql, order_clause)
+            cursor = conn.execute(id_query, full_params)
+            release_ids = [row[0] for row in cursor.fetchall()]
+
+            # 6. Hydrate the page
+            rows = self._hydrate_releases(conn, release_ids)
+            self._lru_store(self._page_cache, key, rows, self.PAGE_CACHE_SIZE)
+
+        return list(rows), total_rows
+
+    def _get_id_by_name(self, table: str, name: str) -> int | None:
+        """
+        Fetches the ID of a row in a lookup table given its exact name. The
+        whole name to ID mapping of the table is loaded in one query on the
+        first lookup, and reused until the lookup caches are cleared.
+
+        :param table: Table name (e.g. 'genres').
+        :type table: str
+        :param name: The name to search for.
+        :type name: str
+        :returns: The integer ID of the row, or None if not found.
+        :rtype: int | None
+        """
+        if table not in self._name_id_cache:
+            self._name_id_cache[table] = self._get_all_ids_by_name(table)
+        return self._name_id_cache[table].get(name)
+
+    def _get_all_ids_by_name(self, table: str) -> Dict[str, int]:
+        """
+        Fetches the name to ID mapping of a lookup table in one query.
+
+        :param table: Table name (e.g. 'genres').
+        :type table: str
+        :returns: Dictionary mapping each name to its ID.
+        :rtype: Dict[str, int]
+        """
+        with self._get_db_connection() as conn:
+            # Descending so the lowest ID wins for duplicate artist names
+            cursor = conn.execute(f"SELECT name, id FROM {table} ORDER BY id DESC;")
+            return dict(cursor.fetchall())
 
-        return rows, total_rows
+    def clear_lookup_caches(self):
+        """
+        Clear the memoised name to ID lookups.
+        """
+        self._name_id_cache.clear()
 
     def get_all_artists(self):
         """
@@ -798,23 +1413,21 @@ class DatabaseManager:
         :returns: The integer ID of the artist, or None if not found.
         :rtype: int | None
         """
-        with self._get_db_connection() as conn:
-            query = """
-            SELECT
-                id
-            FROM artists
-            WHERE name = ?;
-            """
-            # Pass the artist_name as a tuple to the execute method.
-            # This safely substitutes the '?' placeholder.
-            cursor = conn.execute(query, (artist_name,))
+        return self._get_id_by_name("artists", artist_name)
 
-            # Fetch the first (and only expected) result.
-            # fetchone() returns a single Row object or None.
-            row = cursor.fetchone()
+    def _get_all(self, table: str):
+        """
+        Fetches all rows of a lookup table (genres, styles or labels).
 
-            # Extract the 'id' from the row if it exists.
-            return row["id"] if row else None
+        :param table: Table name (e.g. 'genres').
+        :type table: str
+        :returns: List of dictionaries with 'id' and 'name'.
+        :rtype: list[dict]
+        """
+        with self._get_db_connection() as conn:
+            cursor = conn.execute(self.GET_ALL_QUERIES[table])
+            # Use dict() to convert Row objects to dictionaries for easier consumption
+            return [dict(row) for row in cursor.fetchall()]
 
     def get_all_genres(self):
         """
@@ -823,17 +1436,7 @@ class DatabaseManager:
         :returns: List of dictionaries with 'id' and 'name'.
         :rtype: list[dict]
         """
-        with self._get_db_connection() as conn:
-            query = """
-            SELECT 
-                id, 
-                name
-            FROM genres
-            ORDER BY id;
-            """
-            cursor = conn.execute(query)
-            # Use dict() to convert Row objects to dictionaries for easier consumption
-            return [dict(row) for row in cursor.fetchall()]
+        return self._get_all("genres")
 
     def get_genre_id_by_name(self, genre: str) -> int | None:
         """
@@ -843,23 +1446,7 @@ class DatabaseManager:
         :returns: The integer ID of the genre, or None if not found.
         :rtype: int | None
         """
-        with self._get_db_connection() as conn:
-            query = """
-            SELECT
-                id
-            FROM genres
-            WHERE name = ?;
-            """
-            # Pass the artist_name as a tuple to the execute method.
-            # This safely substitutes the '?' placeholder.
-            cursor = conn.execute(query, (genre,))
-
-            # Fetch the first (and only expected) result.
-            # fetchone() returns a single Row object or None.
-            row = cursor.fetchone()
-
-            # Extract the 'id' from the row if it exists.
-            return row["id"] if row else None
+        return self._get_id_by_name("genres", genre)
 
     def get_all_styles(self):
         """
@@ -868,17 +1455,7 @@ class DatabaseManager:
         :returns: List of dictionaries with 'id' and 'name'.
         :rtype: list[dict]
         """
-        with self._get_db_connection() as conn:
-            query = """
-            SELECT 
-                id, 
-                name
-            FROM styles
-            ORDER BY name;
-            """
-            cursor = conn.execute(query)
-            # Use dict() to convert Row objects to dictionaries for easier consumption
-            return [dict(row) for row in cursor.fetchall()]
+        return self._get_all("styles")
 
     def get_style_id_by_name(self, style: str) -> int | None:
         """
@@ -888,23 +1465,7 @@ class DatabaseManager:
         :returns: The integer ID of the style, or None if not found.
         :rtype: int | None
         """
-        with self._get_db_connection() as conn:
-            query = """
-            SELECT
-                id
-            FROM styles
-            WHERE name = ?;
-            """
-            # Pass the artist_name as a tuple to the execute method.
-            # This safely substitutes the '?' placeholder.
-            cursor = conn.execute(query, (style,))
-
-            # Fetch the first (and only expected) result.
-            # fetchone() returns a single Row object or None.
-            row = cursor.fetchone()
-
-            # Extract the 'id' from the row if it exists.
-            return row["id"] if row else None
+        return self._get_id_by_name("styles", style)
 
     def get_all_labels(self):
         """
@@ -913,17 +1474,7 @@ class DatabaseManager:
         :returns: List of dictionaries with 'id' and 'name'.
         :rtype: list[dict]
         """
-        with self._get_db_connection() as conn:
-            query = """
-            SELECT 
-                id, 
-                name
-            FROM labels
-            ORDER BY name;
-            """
-            cursor = conn.execute(query)
-            # Use dict() to convert Row objects to dictionaries for easier consumption
-            return [dict(row) for row in cursor.fetchall()]
+        return self._get_all("labels")
 
     def get_label_id_by_name(self, label: str) -> int | None:
         """
@@ -933,23 +1484,7 @@ class DatabaseManager:
         :returns: The integer ID of the label, or None if not found.
         :rtype: int | None
         """
-        with self._get_db_connection() as conn:
-            query = """
-            SELECT
-                id
-            FROM labels
-            WHERE name = ?;
-            """
-            # Pass the artist_name as a tuple to the execute method.
-            # This safely substitutes the '?' placeholder.
-            cursor = conn.execute(query, (label,))
-
-            # Fetch the first (and only expected) result.
-            # fetchone() returns a single Row object or None.
-            row = cursor.fetchone()
-
-            # Extract the 'id' from the row if it exists.
-            return row["id"] if row else None
+        return self._get_id_by_name("labels", label)
 
     def get_unique_formats(self) -> list[str]:
         """
@@ -966,10 +1501,11 @@ class DatabaseManager:
             WHERE format IS NOT NULL AND format != ''
             ORDER BY format ASC;
             """
-            cursor = conn.execute(query)
-            # fetchall() returns a list of Row objects (which behave like tuples).
-            # We use a list comprehension to extract the first (and only) column value (the format string).
-            return [row[0] for row in cursor.fetchall()]
+            # Plain tuples are enough for a single column, so skip building
+            # Row objects and extract the format strings with itemgetter in C.
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            return list(map(itemgetter(0), cursor.execute(query)))
 
     def get_all_custom_field_values(self) -> Dict[int, List[str]]:
         """
@@ -1,5 +1,7 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 import logging
-import os
 from pathlib import Path
 import re
 import shutil
@@ -10,6 +12,10 @@ import discogs_client as dc
 from core.database_manager import DatabaseManager
 from core.core_classes import PaginatedReleaseRequest
 
+REGEX_STRING = r"^\s*(?:the|an?|el|las?|los|un[ae]?|les?|lo|gli|eine?|il)\s+"
+# Compiled once at import rather than on every artist name check.
+PREFIX_RE = re.compile(REGEX_STRING, re.IGNORECASE)
+
 
 class DiscogsConn:
     """
@@ -21,7 +27,8 @@ class DiscogsConn:
     CACHE_FOLDER = BASE_DIR / "cache"
     SECRETS_LOCATION = CACHE_FOLDER / "secrets.txt"
     CLIENT_NAME = "FBM3334Client/0.3"
-    REGEX_STRING = r"^\s*(?:the|a|el|la|los|las|un|una|le|la|les|un|une|il|lo|la|gli|le|ein|eine)\s+"
+    API_WORKERS = 4
+    COLLECTION_PAGE_SIZE = 100
 
     def __init__(self):
         self.pat = None
@@ -33,6 +40,8 @@ class DiscogsConn:
         logging.debug(f"State of PAT after initialisation = {self.pat}")
         self.pull_name_sort_from_discogs = True
         self.thorough_name_fetch = False
+        # Release ID to artists sort name, for releases fetched from the API
+        self._release_sort_cache: Dict[int, str | None] = {}
 
     def load_token(self):
         """
@@ -74,13 +83,9 @@ class DiscogsConn:
         :param token: Personal access token
         """
         self.pat = token
-        try:
-            with open(self.SECRETS_LOCATION, "x", encoding="utf-8") as file:
-                file.write(f"{token}")
-        except FileExistsError:
-            os.remove(self.SECRETS_LOCATION)
-            with open(self.SECRETS_LOCATION, "x", encoding="utf-8") as file:
-                file.write(f"{token}")
+        # Mode "w" truncates an existing file, so no exists/remove is needed
+        with open(self.SECRETS_LOCATION, "w", encoding="utf-8") as file:
+            file.write(f"{token}")
 
     def connect_client(self):
         """
@@ -109,7 +114,6 @@ class DiscogsConn:
         :param progress_callback: Optional callback to report progress
         :type progress_callback: callable
         """
-        output_list = []
         if not self.client:
             self.connect_client()
         if not self.user:
@@ -117,55 +121,102 @@ class DiscogsConn:
 
         if hasattr(self.user, "collection_folders"):
             releases_to_process = self.user.collection_folders[0].releases
+        # Use the largest page size the API allows to minimise requests
+        releases_to_process.per_page = self.COLLECTION_PAGE_SIZE
         total_releases = len(releases_to_process)
 
         custom_field_ids = set()
 
-        for i, item in enumerate(releases_to_process):
-            # item.data contains exactly what we need
-            # We don't need self.client.release() usually, unless we need extra deep data
-            basic_info = item.data.get("basic_information")
-            if basic_info:
-                output_list.append((basic_info, item.notes))
+        def release_generator():
+            """Yield each release as it is read, so it is written straight away."""
+            for i, item in enumerate(self._iter_pages(releases_to_process)):
+                # item.data contains exactly what we need
+                # We don't need self.client.release() usually, unless we need extra deep data
+                basic_info = item.data.get("basic_information")
+                if basic_info:
+                    yield (basic_info, item.notes)
 
-            if item.notes:
-                for note in item.notes:
-                    custom_field_id = note["field_id"]
-                    custom_field_ids.add(custom_field_id)
+                if item.notes:
+                    for note in item.notes:
+                        custom_field_id = note["field_id"]
+                        custom_field_ids.add(custom_field_id)
 
-            if progress_callback:
-                progress_callback(i + 1, total_releases)
+                if progress_callback:
+                    progress_callback(i + 1, total_releases)
 
-        self.custom_ids = custom_field_ids
+        self.db.add_releases_to_db(release_generator())
 
-        self.db.add_releases_to_db(output_list)
+        self.custom_ids = custom_field_ids
 
         self.db._load_custom_field_ids_from_db()
 
-    def _fetch_sort_name_from_api(self, artist_id, default_name):
+    def _iter_pages(self, paginated_list):
+        """
+        Iterate over the items of a paginated Discogs list, fetching the
+        pages concurrently. Items are yielded in order as soon as their page
+        arrives, so the caller's database writes overlap the remaining
+        requests. At most API_WORKERS pages are requested ahead, so only a
+        few pages are held in memory at once however large the collection
+        is. The Discogs client backs off by itself when rate limited.
+
+        :param paginated_list: Discogs paginated list
+        """
+        # Page 1 comes back with the pagination info, and the client keeps
+        # it, so asking for it here doesn't send a second request
+        pages = iter(range(1, paginated_list.pages + 1))
+        with ThreadPoolExecutor(max_workers=self.API_WORKERS) as executor:
+            in_flight = deque(
+                (page, executor.submit(paginated_list.page, page))
+                for page in islice(pages, self.API_WORKERS)
+            )
+            while in_flight:
+                page, future = in_flight.popleft()
+                # Raises any request error, in page order
+                items = future.result()
+                # The client keeps every page it fetches, so drop this one
+                # from its cache now it is being handed over
+                paginated_list._pages.pop(page, None)
+                for next_page in islice(pages, 1):
+                    in_flight.append(
+                        (next_page, executor.submit(paginated_list.page, next_page))
+                    )
+                yield from items
+
+    def _fetch_sort_name_from_api(self, artist_id, default_name, release_map):
         """
         Uses the Discogs client to find the accurate sort name.
 
         :param artist_id: Artist ID
         :param default_name: Default name
+        :param release_map: Dictionary mapping artist ID to a release ID and
+            its stored artists sort name
         :return: Sort name
         """
 
-        # Fetch artist details from API (Rate limits apply)
-        # artist_obj = self.client.artist(artist_id)
-
         # If name sort is disabled, then don't bother sorting, just return the default name
         if self.pull_name_sort_from_discogs is False:
             return default_name
 
         # Find a related release to get the 'artists_sort' field
-        first_release_id = self.db.get_first_release_from_artist(artist_id)
+        first_release_id, artists_sort = release_map.get(artist_id, (None, None))
+
+        # Use the sort name already stored against the release if there is one
+        if artists_sort:
+            return artists_sort
 
         if first_release_id is not None:
+            # Artists sharing a first release only need it fetched once
+            if first_release_id in self._release_sort_cache:
+                return self._release_sort_cache[first_release_id] or default_name
+
             if hasattr(self.client, "release"):
-                release = self.client.release(first_release_id[0])
-                release.refresh()  # Ensure full data
-                return release.data.get("artists_sort", default_name)
+                release = self.client.release(first_release_id)
+                # The release is lazy, so this is its only request
+                release.refresh()
+                artists_sort = release.data.get("artists_sort")
+                # Stored with the batched updates, so it isn't fetched again
+                self._release_sort_cache[first_release_id] = artists_sort
+                return artists_sort or default_name
         else:
             return default_name
 
@@ -173,15 +224,18 @@ class DiscogsConn:
         """
         Check the artist prefix against a regular expression,
         """
-        return re.match(self.REGEX_STRING, artist_name, re.IGNORECASE) is not None
+        if not artist_name:
+            return False
+        return PREFIX_RE.match(artist_name) is not None
 
-    def _determine_sort_name(self, artist_id, artist_name):
+    def _determine_sort_name(self, artist_id, artist_name, release_map):
         """
         Determines the correct sort name, using simple check or API fetch.
 
-        :param conn: Database connection.
         :param artist_id: Artist ID.
         :param artist_name: Artist name.
+        :param release_map: Dictionary mapping artist ID to a release ID and
+            its stored artists sort name.
         """
         thorough = self.thorough_name_fetch
 
@@ -191,7 +245,7 @@ class DiscogsConn:
 
         # 2. API Fetch (Slow Path)
         try:
-            return self._fetch_sort_name_from_api(artist_id, artist_name)
+            return self._fetch_sort_name_from_api(artist_id, artist_name, release_map)
         except Exception as e:
             logging.log(
                 logging.DEBUG, f"Error fetching sort name for {artist_name}: {e}"
@@ -213,7 +267,8 @@ class DiscogsConn:
 
     def _process_and_batch_updates(self, artists_to_check, progress_callback):
         """
-        Iterates through artists, determines sort names, and commits in batches.
+        Iterates through artists, determines sort names, and commits them in
+        one batch.
 
         :param artists_to_check: Artists to check
         :param progress_callback: Optional progress callback
@@ -221,25 +276,35 @@ class DiscogsConn:
 
         total = len(artists_to_check)
         updates = []  # Store tuples (sort_name, id)
-
-        for i, row in enumerate(artists_to_check):
-            a_id, a_name = row["id"], row["name"]
-
-            # Determine the sort name using the refactored helper
-            sort_name = self._determine_sort_name(a_id, a_name)
-            updates.append((sort_name, a_id))
-
-            if progress_callback:
-                progress_callback(i + 1, total)
-
-            # Batch update every 10
-            if len(updates) >= 10:
-                self.db.commit_batch_updates(updates)
-                updates = []
-
-        # Commit remaining
+        # Look up a release for every artist once, rather than once per artist
+        release_map = self.db.get_first_release_by_artist()
+
+        # The API calls are network bound, so overlap them with a small pool.
+        # The Discogs client backs off by itself when rate limited.
+        with ThreadPoolExecutor(max_workers=self.API_WORKERS) as executor:
+            futures = {
+                executor.submit(
+                    self._determine_sort_name, row["id"], row["name"], release_map
+                ): row["id"]
+                for row in artists_to_check
+            }
+
+            for i, future in enumerate(as_completed(futures)):
+                # Determine the sort name using the refactored helper
+                updates.append((future.result(), futures[future]))
+
+                if progress_callback:
+                    progress_callback(i + 1, total)
+
+        # Commit all of the updates, and the release sort names fetched for
+        # them, in a single transaction
+        release_sorts = [
+            (artists_sort, release_id)
+            for release_id, artists_sort in self._release_sort_cache.items()
+            if artists_sort
+        ]
         if updates:
-            self.db.commit_batch_updates(updates)
+            self.db.commit_batch_updates(updates, release_sorts)
 
     def fetch_artist_sort_names(self, progress_callback=None):
         """
@@ -251,6 +316,24 @@ class DiscogsConn:
         if not artists_to_check:
             return
 
+        # Unless doing a thorough fetch, names without a prefix are their own
+        # sort name, so write these in one go and only check the rest.
+        if not self.thorough_name_fetch:
+            fast_updates = []
+            slow_artists = []
+            for row in artists_to_check:
+                if self._check_artist_prefix(row["name"]):
+                    slow_artists.append(row)
+                else:
+                    fast_updates.append((row["name"], row["id"]))
+
+            if fast_updates:
+                self.db.commit_batch_updates(fast_updates)
+            artists_to_check = slow_artists
+
+        if not artists_to_check:
+            return
+
         if not self.client:
             self.connect_client()
 
@@ -387,10 +470,17 @@ class DiscogsConn:
         """
         return self.db.get_label_id_by_name(label)
 
+    def close(self):
+        """Close the database connection."""
+        self.db.close()
+
     def clear_cache_rebuild_db(self):
         """Clear the cache files and rebuild the database."""
-        # Clear the cache folder
+        # The same DatabaseManager is rebuilt under its lock, rather than
+        # replaced, so reads in progress or waiting never see a closed one
+        self.db.rebuild(self._clear_cache_folder)
+
+    def _clear_cache_folder(self):
+        """Clear the cache folder, leaving it empty."""
         shutil.rmtree(self.CACHE_FOLDER)
         self.CACHE_FOLDER.mkdir()
-        # Initialise the database again
-        self.db = DatabaseManager()
@@ -1,10 +1,13 @@
+from copy import deepcopy
+from dataclasses import replace
 from datetime import datetime, timezone
+from functools import partial
 import logging
 from pathlib import Path
-import shutil
+import time
 from typing import List, Dict, Any, Union
 
-from nicegui import ui, run
+from nicegui import background_tasks, ui, run
 from nicegui.elements.spinner import Spinner
 import tomlkit as tk
 from tomlkit import TOMLDocument
@@ -14,7 +17,13 @@ from tomlkit.items import Table
 from core.discogs_conn import DiscogsConn
 from core.core_classes import PaginatedReleaseRequest, PaginatedTableData
 from gui.gui_classes import IDFilterDefinition, StringFilterDefinition
-from gui.gui_constants import PAGES, FILTER_DEFINITIONS, STATIC_COLUMNS
+from gui.gui_constants import (
+    CELL_SLOTS,
+    FILTER_DEFINITIONS,
+    PAGES,
+    PAGES_BY_KEY,
+    STATIC_COLUMNS,
+)
 
 
 class DiscogsSorterGui:
@@ -24,7 +33,14 @@ class DiscogsSorterGui:
 
     INITIAL_PAGE_SIZE = 20
     INITIAL_PAGE = 0
-    BLANKS_LABEL = "[Blanks]"
+    # Table sort columns which map to a different backend sort
+    SORT_ALIASES = {"artist_name": "artist", None: "artist"}
+    # Delay after the last keystroke before the search is run
+    SEARCH_DEBOUNCE_MS = 300
+    # Delay after the last keystroke before a typed setting is saved
+    SETTINGS_DEBOUNCE_MS = 500
+    # Minimum time between progress re-renders during a refresh (seconds)
+    PROGRESS_REFRESH_INTERVAL = 0.1
     CORE_DIR = Path(__file__).resolve().parent
     BASE_DIR = CORE_DIR.parent.parent
     CACHE_FOLDER = BASE_DIR / "cache"
@@ -54,6 +70,8 @@ class DiscogsSorterGui:
         """
         # Blank config
         self.config: TOMLDocument
+        # Config contents as last loaded/saved, to skip unchanged saves
+        self.saved_config_string: str | None = None
 
         # Current page
         self.current_page_key = 0
@@ -65,6 +83,8 @@ class DiscogsSorterGui:
         self.search_query = ""
         self.progress_string = ""
         self.progress_stage = ""
+        # Monotonic time of the last progress re-render
+        self._last_progress_refresh = 0.0
 
         # Filter IDs
         self.artist_filter_ids = None
@@ -83,6 +103,14 @@ class DiscogsSorterGui:
 
         # Blank table
         self.table: ui.table
+        # Table columns, built once and reused until the custom fields change
+        self._columns: List[Dict[str, Any]] | None = None
+
+        # Last request shown in the table, to skip identical repeat requests
+        self._last_request: PaginatedReleaseRequest | None = None
+
+        # Generation of the latest page prefetch, so superseded ones are skipped
+        self._prefetch_gen = 0
 
     def _perform_initial_fetch(self):
         """
@@ -91,11 +119,17 @@ class DiscogsSorterGui:
         """
         # Fetch initial releases
         initial_request = PaginatedReleaseRequest(
-            page=0, page_size=20, sort_by="artist", desc=False
+            page=self.INITIAL_PAGE,
+            page_size=self.INITIAL_PAGE_SIZE,
+            sort_by="artist",
+            desc=False,
         )
         self.releases, self.num_releases = self.backend.get_releases_paginated(
             request=initial_request
         )
+        # The table shows this page, so the first search or filter change
+        # that leaves the request as it is does not fetch it again
+        self._last_request = initial_request
 
         # Table code inspired by https://github.com/zauberzeug/nicegui/discussions/1903#discussioncomment-8251437
         self.table_data: PaginatedTableData = {
@@ -107,26 +141,43 @@ class DiscogsSorterGui:
             },
         }
 
-    def _dict_to_list_conversion(self, raw_dict: List[Dict[str, Any]]) -> List[str]:
+    def _name_to_id_conversion(self, raw_dict: List[Dict[str, Any]]) -> Dict[str, int]:
         """
-        Convert a list of dictionaries into a list so it can be represented
-        properly in the GUI.
+        Convert a list of dictionaries into a name to ID mapping, keeping
+        the order of the rows. Blank names are dropped, and names shared by
+        several rows (e.g. artists with the same name) are listed once with
+        the lowest ID, matching the backend's name lookups.
 
         :param raw_dict: Raw list of dictionaries.
         :type raw_dict: List[Dict[str, Any]]
-        :return: List containing the items in the dictionaries.
-        :rtype: List[str]
+        :return: Dictionary mapping each name to its ID.
+        :rtype: Dict[str, int]
         """
-        return [item.get("name", self.BLANKS_LABEL) for item in raw_dict]
+        name_to_id: Dict[str, int] = {}
+        for item in raw_dict:
+            name = item["name"]
+            if name and (name not in name_to_id or item["id"] < name_to_id[name]):
+                name_to_id[name] = item["id"]
+        return name_to_id
 
     def _get_lists_filters(self):
         """
-        Create the lists to be used for filtering.
+        Create the lists to be used for filtering, along with the name to ID
+        mappings used by the filter callbacks. The lists are kept as lists,
+        as NiceGUI treats any other options type as a dictionary.
         """
-        self.artist_list = self._dict_to_list_conversion(self.backend.get_all_artists())
-        self.genre_list = self._dict_to_list_conversion(self.backend.get_all_genres())
-        self.style_list = self._dict_to_list_conversion(self.backend.get_all_styles())
-        self.label_list = self._dict_to_list_conversion(self.backend.get_all_labels())
+        filter_rows = {
+            "artist": self.backend.get_all_artists(),
+            "genre": self.backend.get_all_genres(),
+            "style": self.backend.get_all_styles(),
+            "label": self.backend.get_all_labels(),
+        }
+        for filter_type, rows in filter_rows.items():
+            # Example: If filter_type is 'artist', this sets
+            # self.artist_name_to_id and self.artist_list
+            name_to_id = self._name_to_id_conversion(rows)
+            setattr(self, f"{filter_type}_name_to_id", name_to_id)
+            setattr(self, f"{filter_type}_list", list(name_to_id))
 
     def load_toml_config(self):
         """
@@ -137,19 +188,30 @@ class DiscogsSorterGui:
         try:
             with open("cache/config.toml", "r", encoding="utf-8") as f:
                 self.config = tk.load(f)
+            self.saved_config_string = self.config.as_string()
         except FileNotFoundError:
-            # If the file isn't found, then copy over the default config
-            # and load it.
-            shutil.copyfile("defaultconfig.toml", "cache/config.toml")
-            with open("cache/config.toml", "r", encoding="utf-8") as f:
+            # If the file isn't found, then parse the default config once and
+            # save it as the custom config, rather than copying and re-parsing.
+            with open("defaultconfig.toml", "r", encoding="utf-8") as f:
                 self.config = tk.load(f)
+            self.saved_config_string = None
+            self.save_toml_config()
+
+        # Resolve the sort settings into the backend once at load time
+        self._update_sort_settings()
 
     def save_toml_config(self):
         """
-        Save the TOML config.
+        Save the TOML config, skipping the write if nothing has changed since
+        it was last loaded or saved.
         """
+        config_string = tk.dumps(self.config)
+        if config_string == self.saved_config_string:
+            return
+
         with open("cache/config.toml", "w", encoding="utf-8") as f:
-            tk.dump(self.config, f)
+            f.write(config_string)
+        self.saved_config_string = config_string
 
     def _get_custom_field_columns(self) -> List[Dict[str, Any]]:
         """
@@ -190,15 +252,24 @@ class DiscogsSorterGui:
 
     def get_columns(self) -> List[Dict[str, Any]]:
         """
-        Gets the columns of the table.
+        Gets the columns of the table. The list is built on first use and
+        reused by every table refresh until it is invalidated.
 
         :return: A list containing column dictionaries.
         :rtype: list
         """
-        column_list = list(STATIC_COLUMNS)
-        column_list.extend(self._get_custom_field_columns())
+        if self._columns is None:
+            self._columns = list(STATIC_COLUMNS)
+            self._columns.extend(self._get_custom_field_columns())
 
-        return column_list
+        return self._columns
+
+    def _invalidate_columns(self):
+        """
+        Invalidate the table columns, so they are rebuilt with the current
+        custom fields and their names.
+        """
+        self._columns = None
 
     def _toggle_columns(self, column: dict, visible: bool):
         """
@@ -213,19 +284,6 @@ class DiscogsSorterGui:
         column["headerClasses"] = "" if visible else "hidden"
         self.table.update()
 
-    def get_full_count(self) -> int:
-        """
-        Get the count of releases and save the count (equal to the number of
-        rows).
-
-        :return: Count of releases.
-        :rtype: int
-        """
-        request = PaginatedReleaseRequest(page=0, page_size=1)
-        _, count = self.backend.get_releases_paginated(request)
-        self.table_data["pagination"]["rowsNumber"] = count
-        return count
-
     def _normalise_pagination_request(self, request: Any) -> dict:
         """
         Normalises the pagination request from a NiceGUI request or a manual
@@ -254,16 +312,11 @@ class DiscogsSorterGui:
         pagination = self.table_data["pagination"]
         pagination.update(new_pagination)
         pagination_sort = new_pagination.get("sortBy", "artist")
-
-        pagination_sort = (
-            "artist" if pagination_sort == "artist_name" else pagination_sort
+        # With no sort column, the default is ascending by artist
+        pagination_desc = pagination_sort is not None and new_pagination.get(
+            "descending", False
         )
-
-        pagination_desc = new_pagination.get("descending", False)
-
-        if pagination_sort is None:
-            pagination_sort = "artist"
-            pagination_desc = False
+        pagination_sort = self.SORT_ALIASES.get(pagination_sort, pagination_sort)
 
         request = PaginatedReleaseRequest(
             page=pagination["page"] - 1,
@@ -279,12 +332,57 @@ class DiscogsSorterGui:
             custom_field_filters=self.custom_field_filter_ids,
         )
 
+        # The table already shows this request, e.g. the same search again
+        if request == self._last_request:
+            return
+
         new_rows, count = self.backend.get_releases_paginated(request)
+        # Copied, as the filter lists and dictionary are updated in place
+        self._last_request = deepcopy(request)
 
         self.table_data["pagination"]["rowsNumber"] = count
 
         self.table_data["rows"] = new_rows
-        self.paginated_table.refresh()
+        # Update the existing table in place, rather than rebuilding it with
+        # its columns and slots for every page
+        self.table.rows = new_rows
+        self.table.pagination = self.table_data["pagination"]
+        self.table.update()
+
+        self._prefetch_next_page(request, count)
+
+    def _prefetch_next_page(self, request: PaginatedReleaseRequest, count: int):
+        """
+        Fetch the page after the one just shown in the background, so that it
+        is served from the backend's page cache if the user pages forward.
+
+        :param request: Request for the page just shown.
+        :type request: PaginatedReleaseRequest
+        :param count: Total number of rows matching the request.
+        :type count: int
+        """
+        self._prefetch_gen += 1
+        if request.page_size <= 0 or (request.page + 1) * request.page_size >= count:
+            return
+
+        next_request = replace(request, page=request.page + 1)
+        background_tasks.create(
+            run.io_bound(self._prefetch_page, next_request, self._prefetch_gen),
+            name="prefetch next page",
+        )
+
+    def _prefetch_page(self, request: PaginatedReleaseRequest, generation: int):
+        """
+        Fetch a page into the backend's page cache, unless a newer page has
+        been requested since it was scheduled.
+
+        :param request: Request for the page to prefetch.
+        :type request: PaginatedReleaseRequest
+        :param generation: Prefetch generation when it was scheduled.
+        :type generation: int
+        """
+        if generation == self._prefetch_gen:
+            self.backend.get_releases_paginated(request)
 
     def _send_manual_pagination_request(self):
         """
@@ -311,25 +409,27 @@ class DiscogsSorterGui:
 
         :param query: Search query
         """
+        if query.value == self.search_query:
+            return
         self.search_query = query.value
         self._send_manual_pagination_request()
 
-    def _generic_select_callback(self, filter_type: str, id_lookup_method, query):
+    def _generic_select_callback(
+        self, filter_type: str, name_to_id: Dict[str, int], query
+    ):
         """
         A generic callback function for all ID-based selection filters
         (Artist, Genre, Style, Label).
 
         :param filter_type: The base name of the filter ('artist', 'genre', 'style', 'label').
         :type filter_type: str
-        :param id_lookup_method: The DiscogsManager method used to find the ID by name.
+        :param name_to_id: The name to ID mapping built with the filter options.
+        :type name_to_id: Dict[str, int]
         :param query: The multiselect query object from NiceGUI (contains selected values).
         """
-        name_list = query.value
-        id_list = []
-
-        for name in name_list:
-            # Calls self.manager.get_artist_id_by_name(name) or similar
-            id_list.append(id_lookup_method(name))
+        # Names without an ID are dropped rather than filtered on as NULL.
+        ids = map(name_to_id.get, query.value)
+        id_list = [id_ for id_ in ids if id_ is not None]
 
         # Dynamically set the correct filter attribute
         # Example: If filter_type is 'artist', this sets self.artist_filter_ids
@@ -337,9 +437,8 @@ class DiscogsSorterGui:
 
         if id_list:
             setattr(self, attribute_name, id_list)
-            logging.log(
-                logging.DEBUG, f"Set {attribute_name}: {id_list}"
-            )  # Replace with proper logging
+            # Formatted lazily, only if debug logging is enabled
+            logging.debug("Set %s: %s", attribute_name, id_list)
         else:
             setattr(self, attribute_name, None)
 
@@ -358,9 +457,8 @@ class DiscogsSorterGui:
         if selected_values:
             # Set the attribute to the list of selected strings
             setattr(self, attribute_name, selected_values)
-            logging.log(
-                logging.DEBUG, f"Set {attribute_name}: {selected_values}"
-            )  # Replace with proper logging
+            # Formatted lazily, only if debug logging is enabled
+            logging.debug("Set %s: %s", attribute_name, selected_values)
         else:
             # Clear the filter
             setattr(self, attribute_name, None)
@@ -402,26 +500,15 @@ class DiscogsSorterGui:
             rows=self.table_data["rows"],
             columns=self.get_columns(),
             pagination=self.table_data["pagination"],
-            row_key="name",
-        )
-        self.table.add_slot(
-            "body-cell-release_url",
-            """
-            <q-td :props="props">
-                <u><a :href="props.value">Link</a></u>
-            </q-td>
-        """,
-        )
-        self.table.add_slot(
-            "body-cell-thumb",
-            """
-            <q-td :props="props">
-                <img :src="props.value" style="max-width: 50px; max-height: 50px;">
-            </q-td>
-        """,
+            row_key="id",
         )
+        for slot_name, template in CELL_SLOTS.items():
+            self.table.add_slot(slot_name, template)
 
-        self.table.classes("virtual-scroll h-[calc(100vh-200px)] w-full max-w-none")
+        # Quasar's virtual scroll only renders the rows in view, which keeps
+        # large pages (e.g. showing all rows) cheap. It needs the fixed height.
+        self.table.classes("h-[calc(100vh-200px)] w-full max-w-none")
+        self.table.props("virtual-scroll")
         self.table.on("request", self.do_pagination)
 
     def discogs_connection_callback(self):
@@ -541,6 +628,10 @@ class DiscogsSorterGui:
                 self.backend.fetch_artist_sort_names, self.update_progress_string
             )
             ui.notify("Refresh complete.")
+            # The refresh may have added custom fields, and the rows shown
+            # are stale
+            self._invalidate_columns()
+            self._last_request = None
             self._send_manual_pagination_request()
             self.paginated_table.refresh()
             logging.log(logging.DEBUG, "All done")
@@ -560,6 +651,7 @@ class DiscogsSorterGui:
             self.custom_field_data: Dict[int, List[str]] = (
                 self.backend.get_all_custom_field_values()
             )
+            self._get_lists_filters()
             self.build_filter_dropdowns.refresh()
         else:
             if self.backend.check_token() is False:
@@ -591,13 +683,27 @@ class DiscogsSorterGui:
 
     def update_progress_string(self, current, total):
         """
-        Update the progress string.
+        Update the progress string. The footer is re-rendered at most once
+        per PROGRESS_REFRESH_INTERVAL, apart from the final update.
 
         :param current: Current number.
         :param total: Total number.
         """
+        now = time.monotonic()
+        # Always show the final count, so the stage is seen to complete
+        if (
+            current < total
+            and now - self._last_progress_refresh < self.PROGRESS_REFRESH_INTERVAL
+        ):
+            return
         progress_percentage = (current / total) * 100.0
-        self.progress_string = f"{self.progress_stage} ({progress_percentage:.1f}%)"
+        progress_string = f"{self.progress_stage} ({progress_percentage:.1f}%)"
+        # Large collections report many items per 0.1%, so only re-render
+        # the footer when the text shown actually changes
+        if progress_string == self.progress_string:
+            return
+        self.progress_string = progress_string
+        self._last_progress_refresh = now
         self.footer_update_text.refresh()
 
     # Adjust the type hint to accept either of the new dataclasses
@@ -613,19 +719,18 @@ class DiscogsSorterGui:
         if definition.callback_type == "string":
             # --- String-based filter (Format) ---
             # The IDE knows 'definition' is a StringFilterDefinition here
-            def callback(query):
-                return self._generic_string_callback(definition.attribute_name, query)
+            callback = partial(
+                self._generic_string_callback, definition.attribute_name
+            )
         else:
             # --- ID-based filter (Artist, Genre, etc.) ---
             # The IDE knows 'definition' is an IDFilterDefinition here
 
-            # Get the actual manager method (e.g., self.manager.get_artist_id_by_name)
-            lookup_method = getattr(self.backend, definition.manager_lookup)
-
-            def callback(query):
-                return self._generic_select_callback(
-                    definition.filter_type, lookup_method, query
-                )
+            # Get the name to ID mapping (e.g., self.artist_name_to_id)
+            name_to_id = getattr(self, definition.id_map_attr)
+            callback = partial(
+                self._generic_select_callback, definition.filter_type, name_to_id
+            )
 
         # 3. Build the UI element
         ui.select(
@@ -651,15 +756,13 @@ class DiscogsSorterGui:
             except NonExistentKey:
                 name = f"Custom Field {field_id}"
 
-            # Use a lambda function to pass the field_id to the callback
+            # Use a partial to pass the field_id to the callback
             ui.select(
                 values,
                 multiple=True,
                 label=f"{name} Filter",
                 with_input=True,
-                on_change=lambda query, id=field_id: self.custom_field_select_callback(
-                    id, query
-                ),
+                on_change=partial(self.custom_field_select_callback, field_id),
             ).classes("w-70").props("use-chips")
 
     def navigate_refresh_left_drawer(self, page_key):
@@ -671,7 +774,7 @@ class DiscogsSorterGui:
         self.current_page_key = page_key
 
         # Find the page data using the key
-        target_page = next((p for p in PAGES if p.key == page_key), None)
+        target_page = PAGES_BY_KEY.get(page_key)
 
         if target_page:
             ui.navigate.to(target_page.route)
@@ -695,7 +798,7 @@ class DiscogsSorterGui:
                 is_selected = self.current_page_key == page.key
 
                 with ui.item(
-                    on_click=lambda p=page: self.navigate_refresh_left_drawer(p.key)
+                    on_click=partial(self.navigate_refresh_left_drawer, page.key)
                 ).classes(
                     selected_page_class if is_selected else deselected_page_class
                 ):
@@ -731,21 +834,22 @@ class DiscogsSorterGui:
 
     def _build_update_settings(self):
         """
-        Build the update settings.
+        Build the update settings. The typed inputs are debounced, so the
+        config is saved once typing pauses rather than on every keystroke.
         """
         ui.label("Update Settings").classes("text-xl font-bold")
         with ui.row().classes("items-center w-full"):
             ui.label("Auto-update")
             ui.space()
-            ui.switch(on_change=lambda: self.save_toml_config()).bind_value(
+            ui.switch(on_change=self.save_toml_config).bind_value(
                 self.config["Updates"], "auto_update"
             )
         with ui.row().classes("items-center w-full"):
             ui.label("Auto-update interval (hours)")
             ui.space()
-            ui.number(
-                precision=0, on_change=lambda: self.save_toml_config()
-            ).bind_value(self.config["Updates"], "update_interval")
+            ui.number(precision=0, on_change=self.save_toml_config).bind_value(
+                self.config["Updates"], "update_interval"
+            ).props(f"debounce={self.SETTINGS_DEBOUNCE_MS}")
         with ui.row().classes("items-center w-full"):
             ui.label("Update date/time display format -")
             ui.link(
@@ -754,9 +858,9 @@ class DiscogsSorterGui:
                 new_tab=True,
             )
             ui.space()
-            ui.textarea(on_change=lambda: self.save_toml_config()).bind_value(
+            ui.textarea(on_change=self.save_toml_config).bind_value(
                 self.config["Updates"], "update_time_display_format"
-            )
+            ).props(f"debounce={self.SETTINGS_DEBOUNCE_MS}")
 
     def _build_custom_field_name_settings(self):
         """
@@ -773,9 +877,17 @@ class DiscogsSorterGui:
             with ui.row().classes("items-center w-full"):
                 ui.label(f"Custom field {label} name")
                 ui.space()
-                ui.input(on_change=lambda: self.save_toml_config()).bind_value(
+                ui.input(on_change=self._custom_field_name_callback).bind_value(
                     self.config["CustomFields"], f"field_{label}"
-                )
+                ).props(f"debounce={self.SETTINGS_DEBOUNCE_MS}")
+
+    def _custom_field_name_callback(self):
+        """
+        Custom field name callback - saves the config and rebuilds the
+        columns with the new name.
+        """
+        self._invalidate_columns()
+        self.save_toml_config()
 
     def _column_show_hide_callback(self, column: dict, visible: bool):
         """
@@ -852,8 +964,8 @@ class DiscogsSorterGui:
     def _update_sort_settings(self):
         """Update the sort settings."""
         self.backend.update_sort_settings(
-            self.config["Sorting"]["pull_name_sort_from_discogs"],
-            self.config["Sorting"]["thorough_name_fetch"],
+            self._get_nested_config_value("Sorting.pull_name_sort_from_discogs", True),
+            self._get_nested_config_value("Sorting.thorough_name_fetch", False),
         )
 
     def build_settings_page(self):
@@ -938,8 +1050,9 @@ class DiscogsSorterGui:
         with ui.row().classes(
             "items-center justify-between content-between w-full bg-clip-padding"
         ):
+            # Debounce the input so a burst of typing runs one search
             ui.input("Search", on_change=self.search_callback).props(
-                "clearable rounded outlined dense"
+                f"clearable rounded outlined dense debounce={self.SEARCH_DEBOUNCE_MS}"
             )
             ui.button(icon="refresh", on_click=self.start_refresh)
             ui.space()
@@ -958,3 +1071,5 @@ class DiscogsSorterGui:
         self.backend.clear_cache_rebuild_db()
         # Copy the default TOML configuration by calling a load
         self.load_toml_config()
+        self._invalidate_columns()
+        self._last_request = None
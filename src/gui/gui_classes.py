@@ -3,7 +3,7 @@ Docstring for src.gui.gui_classes
 '''
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True)
 class SidebarPage:
     """Represents a page/item in the sidebar."""
     key: int
@@ -15,7 +15,7 @@ class SidebarPage:
 class IDFilterDefinition:
     label: str
     data_list_attr: str      # The name of the list attribute on self (e.g., 'artist_list')
-    manager_lookup: str      # The manager method name (e.g., 'get_artist_id_by_name')
+    id_map_attr: str         # The name to ID mapping attribute on self (e.g., 'artist_name_to_id')
     filter_type: str         # The base name for the filter attribute (e.g., 'artist')
     attribute_name: str = 'Unused'
     callback_type: str = 'id'
@@ -26,5 +26,5 @@ class StringFilterDefinition:
     data_list_attr: str
     attribute_name: str      # The name of the instance attribute to update (e.g., 'format_selected_list')
     callback_type: str = 'string' # Identifier for the builder function
-    manager_lookup: str = 'Unused'
+    id_map_attr: str = 'Unused'
     filter_type: str = 'Unused'
\ No newline at end of file
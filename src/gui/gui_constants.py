@@ -6,30 +6,32 @@ PAGES = [
     # You can easily add more pages here without changing the methods
     # SidebarPage(key=2, label='New Page', icon='add', route='/new'),
 ]
+# Pages keyed by their sidebar key, for navigation lookups
+PAGES_BY_KEY = {page.key: page for page in PAGES}
 
 FILTER_DEFINITIONS = [
     IDFilterDefinition(
         label='Artist Filter',
         data_list_attr='artist_list',
-        manager_lookup='get_artist_id_by_name',
+        id_map_attr='artist_name_to_id',
         filter_type='artist'
     ),
     IDFilterDefinition(
         label='Genre Filter',
         data_list_attr='genre_list',
-        manager_lookup='get_genre_id_by_name',
+        id_map_attr='genre_name_to_id',
         filter_type='genre'
     ),
     IDFilterDefinition(
         label='Style Filter',
         data_list_attr='style_list',
-        manager_lookup='get_style_id_by_name',
+        id_map_attr='style_name_to_id',
         filter_type='style'
     ),
     IDFilterDefinition(
         label='Label Filter',
         data_list_attr='label_list',
-        manager_lookup='get_label_id_by_name',
+        id_map_attr='label_name_to_id',
         filter_type='label'
     ),
     StringFilterDefinition(
@@ -51,4 +53,17 @@ STATIC_COLUMNS = [
     {'name': 'year', 'label': 'Year', 'field': 'year', 'sortable': True},
     {'name': 'format', 'label': 'Format', 'field': 'format', 'sortable': True},
     {'name': 'release_url', 'label': 'Discogs Link', 'field': 'release_url', 'sortable': False},
-]
\ No newline at end of file
+]
+# Templates for the custom table cells, keyed by slot name
+CELL_SLOTS = {
+    'body-cell-release_url': '''
+        <q-td :props="props">
+            <u><a :href="props.value">Link</a></u>
+        </q-td>
+    ''',
+    'body-cell-thumb': '''
+        <q-td :props="props">
+            <img :src="props.value" style="max-width: 50px; max-height: 50px;">
+        </q-td>
+    ''',
+}
@@ -83,6 +83,9 @@ logging.basicConfig(
     force=True,
 )
 
+# Close the long-lived database connection when the app stops.
+app.on_shutdown(dsg.backend.close)
+
 ui.run(
     root,
     favicon="🎧",
@@ -0,0 +1,122 @@
+import threading
+
+import pytest
+
+from core.core_classes import PaginatedReleaseRequest
+from core.database_manager import DatabaseManager
+
+
+def make_release(release_id: int, artists: list[tuple[int, str]]) -> tuple[dict, None]:
+    """
+    Build a minimal (basic_info, notes) tuple as returned by Discogs.
+
+    :param release_id: Release ID
+    :type release_id: int
+    :param artists: (ID, name) of each artist on the release
+    :type artists: list[tuple[int, str]]
+    :return: Release tuple for add_releases_to_db
+    :rtype: tuple[dict, None]
+    """
+    basic_info = {
+        "id": release_id,
+        "title": f"Title {release_id}",
+        "year": 2000,
+        "formats": [{"name": "Vinyl"}],
+        "artists": [{"id": artist_id, "name": name} for artist_id, name in artists],
+        "genres": ["Rock"],
+        "styles": [],
+        "labels": [],
+    }
+    return basic_info, None
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """Database manager backed by a temporary cache folder."""
+    monkeypatch.setattr(DatabaseManager, "CACHE_FOLDER", tmp_path)
+    manager = DatabaseManager()
+    manager.add_releases_to_db(
+        [
+            make_release(1, [(1, "Alice"), (2, "Bob")]),
+            make_release(2, [(1, "Alice")]),
+            make_release(3, [(2, "Bob")]),
+        ]
+    )
+    yield manager
+    manager.close()
+
+
+@pytest.mark.parametrize("sort_by", ["artist", "title"])
+def test_count_matches_rows_for_artist_filter_and_search(db, sort_by):
+    request = PaginatedReleaseRequest(
+        page_size=0,
+        sort_by=sort_by,
+        search_query="Bob",
+        artist_ids=[db.get_artist_id_by_name("Alice")],
+    )
+
+    rows, total = db.get_releases_paginated(request)
+
+    assert total == len(rows) == 1
+    assert rows[0]["id"] == 1
+
+
+def test_rebuild_waits_for_the_lock(db, tmp_path):
+    lock_held = threading.Event()
+    release_lock = threading.Event()
+    files_cleared = threading.Event()
+
+    def hold_lock():
+        with db._lock:
+            lock_held.set()
+            release_lock.wait()
+
+    def clear_files():
+        for path in tmp_path.glob("collection.db*"):
+            path.unlink()
+        files_cleared.set()
+
+    holder = threading.Thread(target=hold_lock, daemon=True)
+    holder.start()
+    lock_held.wait()
+    rebuild = threading.Thread(target=db.rebuild, args=(clear_files,), daemon=True)
+    rebuild.start()
+    try:
+        # The files are not touched while another thread holds the lock
+        assert not files_cleared.wait(timeout=0.2)
+    finally:
+        release_lock.set()
+        holder.join()
+        rebuild.join()
+    assert files_cleared.is_set()
+    assert db.get_releases_paginated(PaginatedReleaseRequest()) == ([], 0)
+
+
+def test_failed_batch_does_not_leave_rolled_back_lookup_ids(db):
+    basic_info, _ = make_release(4, [(1, "Alice")])
+    basic_info["genres"] = ["Jazz"]
+    # A note without a value fails the batch after the genre is resolved
+    with pytest.raises(AttributeError):
+        db.add_releases_to_db([(basic_info, [{"field_id": 1, "value": None}])])
+
+    db.add_releases_to_db([(basic_info, None)])
+
+    rows, total = db.get_releases_paginated(
+        PaginatedReleaseRequest(genre_ids=[db.get_genre_id_by_name("Jazz")])
+    )
+    assert total == 1
+    assert rows[0]["genres"] == "Jazz"
+
+
+def test_cached_page_gains_new_custom_field_column(db):
+    basic_info, _ = make_release(4, [(1, "Alice")])
+    db.add_releases_to_db([(basic_info, [{"field_id": 1, "value": "Mint"}])])
+    request = PaginatedReleaseRequest(sort_by="id", desc=True, page_size=1)
+    # Read before the new custom field ID is loaded, as the UI may do
+    rows, _ = db.get_releases_paginated(request)
+    assert "custom_1" not in rows[0]
+
+    db._load_custom_field_ids_from_db()
+
+    rows, _ = db.get_releases_paginated(request)
+    assert rows[0]["custom_1"] == "Mint"
@@ -0,0 +1,61 @@
+from urllib.parse import parse_qs, urlparse
+
+from discogs_client.models import PaginatedList
+
+from core.discogs_conn import DiscogsConn
+
+
+class CountingClient:
+    """Discogs client stand-in which serves numbered pages and records them."""
+
+    PAGES = 3
+    PER_PAGE = 2
+
+    def __init__(self):
+        self.requested_pages = []
+
+    def _get(self, url: str) -> dict:
+        page = int(parse_qs(urlparse(url).query)["page"][0])
+        self.requested_pages.append(page)
+        return {
+            "items": [page * 10 + i for i in range(self.PER_PAGE)],
+            "pagination": {"pages": self.PAGES, "items": self.PAGES * self.PER_PAGE},
+        }
+
+
+def test_iter_pages_requests_each_page_once():
+    client = CountingClient()
+    paginated_list = PaginatedList(
+        client, "https://api.discogs.com/x", "items", lambda _, item: item
+    )
+    paginated_list.per_page = CountingClient.PER_PAGE
+    # fetch_collection reads the size before iterating
+    assert len(paginated_list) == 6
+
+    # Only the class attributes are needed, so the database isn't opened
+    conn = DiscogsConn.__new__(DiscogsConn)
+    items = list(conn._iter_pages(paginated_list))
+
+    assert items == [10, 11, 20, 21, 30, 31]
+    assert sorted(client.requested_pages) == [1, 2, 3]
+
+
+def test_iter_pages_bounds_the_pages_held():
+    client = CountingClient()
+    client.PAGES = 10
+    paginated_list = PaginatedList(
+        client, "https://api.discogs.com/x", "items", lambda _, item: item
+    )
+    paginated_list.per_page = CountingClient.PER_PAGE
+    conn = DiscogsConn.__new__(DiscogsConn)
+    pages = conn._iter_pages(paginated_list)
+
+    # Take the items of the first page only
+    assert [next(pages), next(pages)] == [10, 11]
+
+    # Only the pages requested ahead are fetched, and the yielded page is
+    # no longer kept by the client
+    assert len(client.requested_pages) <= DiscogsConn.API_WORKERS + 1
+    assert 1 not in paginated_list._pages
+    assert len(list(pages)) == 18
+    assert paginated_list._pages == {}